@@ -1,5 +1,6 @@
 from importlib.metadata import version
 
+from .async_client import AsyncEdgarClient
 from .client import EdgarError, FilerMatch, CompanyMatch, Filing, Filer, DirectoryListing, DirectoryItem, EdgarClient
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "DirectoryListing",
     "DirectoryItem",
     "EdgarClient",
+    "AsyncEdgarClient",
 ]
 __version__ = version("edgar-client")
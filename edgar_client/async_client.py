@@ -0,0 +1,376 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Union
+from urllib.parse import urljoin
+
+from httpx import AsyncClient, HTTPError, Limits, Response, codes
+
+from .client import (
+    BaseEdgarClient,
+    CompanyMatch,
+    DirectoryListing,
+    EdgarError,
+    Filer,
+    FilerMatch,
+    Filing,
+    _FilingColumns,
+    _Submissions,
+    _normalize_cik,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEdgarClient(BaseEdgarClient):
+    """Asynchronous client for interacting with SEC's EDGAR system."""
+
+    # Matches the lru_cache(maxsize=100) on EdgarClient.get_filer
+    FILER_CACHE_SIZE = 100
+
+    def __init__(self, user_agent: str = "CompanyName contact@email.com", timeout: int = 30) -> None:
+        """
+        Initialize the async EDGAR client.
+
+        Args:
+            user_agent: User agent string for SEC requests
+            timeout: Request timeout in seconds
+        """
+        super().__init__(user_agent=user_agent, timeout=timeout)
+        self.client = AsyncClient(
+            timeout=timeout,
+            headers={"User-Agent": user_agent},
+            follow_redirects=True,
+            http2=True,
+            limits=Limits(
+                max_connections=self.MAX_REQUESTS_PER_SECOND,
+                max_keepalive_connections=self.MAX_REQUESTS_PER_SECOND,
+            ),
+        )
+        self._filers: "OrderedDict[str, Filer]" = OrderedDict()
+        # Created lazily so they bind to the running event loop on Python 3.9
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._throttle_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncEdgarClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.client.aclose()
+
+    async def _throttle(self) -> None:
+        """Wait until a request can be sent without exceeding SEC's rate limit."""
+        if self._throttle_lock is None:
+            self._throttle_lock = asyncio.Lock()
+
+        async with self._throttle_lock:
+            if len(self._request_times) == self._request_times.maxlen:
+                wait = self._request_times[0] + 1.0 - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._request_times.append(time.monotonic())
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Make a rate-limited GET request.
+
+        Args:
+            url: Request URL
+            headers: Additional request headers
+
+        Returns:
+            Response object
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_REQUESTS_PER_SECOND)
+
+        async with self._semaphore:
+            await self._throttle()
+            try:
+                response = await self.client.get(url, headers=headers)
+                if response.status_code != codes.NOT_MODIFIED:
+                    response.raise_for_status()
+                return response
+            except HTTPError as e:
+                raise EdgarError(f"HTTP error occurred: {str(e)}") from e
+
+    async def search_filers(
+        self,
+        *,
+        contains: Optional[str] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[FilerMatch]:
+        """
+        Search for filers by name or CIK.
+
+        Args:
+            contains: Filter filer names containing this string (case-insensitive)
+            ciks: Filter by specific CIK numbers
+            limit: Maximum number of results to return
+
+        Returns:
+            List of matching filers
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        url = urljoin(self.BASE_URL, "/Archives/edgar/cik-lookup-data.txt")
+        response = await self.get(url, headers=self._revalidation_headers(url))
+        # Indexing the lookup file takes long enough to stall other requests, so do it in a worker thread
+        index = await asyncio.to_thread(self._cached_resource, url, response, self._parse_filer_index)
+
+        matches = list(self._match_filers(index.rows(), contains, ciks))
+        return matches[:limit] if limit else matches
+
+    async def search_companies(
+        self,
+        *,
+        tickers: Optional[List[str]] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
+        exchanges: Optional[List[str]] = None,
+        contains: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[CompanyMatch]:
+        """
+        Search for companies by various criteria.
+
+        Args:
+            tickers: Filter by ticker symbols (case-insensitive)
+            ciks: Filter by CIK numbers
+            exchanges: Filter by exchange names (case-insensitive)
+            contains: Filter company names containing this string (case-insensitive)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of matching companies
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        url = urljoin(self.BASE_URL, "/files/company_tickers_exchange.json")
+        response = await self.get(url, headers=self._revalidation_headers(url))
+        data = self._cached_resource(url, response, self._parse_company_tickers)
+
+        companies = list(self._match_companies(data.data, tickers, ciks, exchanges, contains))
+        return companies[:limit] if limit else companies
+
+    async def get_filer(self, cik: Union[str, int]) -> Filer:
+        """
+        Retrieve a filer's profile information.
+
+        Args:
+            cik: CIK number
+
+        Returns:
+            Filer profile information
+
+        Raises:
+            EdgarError: If the request fails
+            ValueError: If CIK is invalid
+        """
+        normalized_cik = _normalize_cik(cik)
+        if normalized_cik in self._filers:
+            self._filers.move_to_end(normalized_cik)
+            return self._filers[normalized_cik]
+
+        url = urljoin(self.DATA_URL, f"submissions/CIK{normalized_cik}.json")
+        response = await self.get(url)
+        try:
+            filer = Filer.model_validate_json(response.content)
+        except ValueError as e:
+            raise EdgarError(f"Invalid filer data received: {str(e)}") from e
+
+        self._filers[normalized_cik] = filer
+        if len(self._filers) > self.FILER_CACHE_SIZE:
+            self._filers.popitem(last=False)
+        return filer
+
+    async def get_filings(
+        self,
+        cik: Union[str, int],
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        forms: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Filing]:
+        """
+        Retrieve filings for a given CIK.
+
+        Older filings are split by SEC across additional submission files, which are fetched concurrently.
+
+        Args:
+            cik: CIK number
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by (e.g., ["10-K", "10-Q"])
+            limit: Maximum number of filings to return
+
+        Returns:
+            List of filings
+
+        Raises:
+            EdgarError: If the request fails
+            ValueError: If CIK is invalid
+        """
+        normalized_cik = _normalize_cik(cik)
+        url = urljoin(self.DATA_URL, f"submissions/CIK{normalized_cik}.json")
+        response = await self.get(url)
+        try:
+            data = _Submissions.model_validate_json(response.content)
+        except ValueError as e:
+            raise EdgarError(f"Invalid filings data received: {str(e)}") from e
+
+        files = data.filings.files
+        file_responses = await asyncio.gather(
+            *(self.get(urljoin(self.DATA_URL, f"submissions/{file.name}")) for file in files),
+            return_exceptions=True,
+        )
+
+        batches: List[_FilingColumns] = [data.filings.recent]
+        for file, file_response in zip(files, file_responses):
+            try:
+                if isinstance(file_response, BaseException):
+                    raise file_response
+                batches.append(_FilingColumns.model_validate_json(file_response.content))
+            except Exception as e:
+                logger.error("Error processing filing file %s: %s", file.name, e)
+                continue
+
+        filings = list(self._collect_filings(cik, batches, start_date, end_date, forms))
+        return filings[:limit] if limit else filings
+
+    async def get_filers(self, ciks: Sequence[Union[str, int]]) -> List[Filer]:
+        """
+        Retrieve the profiles of several filers concurrently.
+
+        Args:
+            ciks: CIK numbers
+
+        Returns:
+            Filer profiles, in the same order as the CIKs
+
+        Raises:
+            EdgarError: If any request fails
+            ValueError: If any CIK is invalid
+        """
+        return list(await asyncio.gather(*(self.get_filer(cik) for cik in ciks)))
+
+    async def get_filings_bulk(
+        self,
+        ciks: Sequence[Union[str, int]],
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        forms: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[Union[str, int], List[Filing]]:
+        """
+        Retrieve filings for several CIKs concurrently.
+
+        Args:
+            ciks: CIK numbers
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by (e.g., ["10-K", "10-Q"])
+            limit: Maximum number of filings to return per CIK
+
+        Returns:
+            Filings keyed by CIK, as given
+
+        Raises:
+            EdgarError: If any request fails
+            ValueError: If any CIK is invalid
+        """
+        results = await asyncio.gather(
+            *(self.get_filings(cik, start_date=start_date, end_date=end_date, forms=forms, limit=limit) for cik in ciks)
+        )
+        return dict(zip(ciks, results))
+
+    async def get_filing_directory(self, cik: Union[str, int], accession_number: str) -> DirectoryListing:
+        """
+        Get the directory listing for a specific filing.
+
+        Args:
+            cik: The CIK number
+            accession_number: The accession number of the filing
+
+        Returns:
+            DirectoryListing object containing file information
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        normalized_cik = _normalize_cik(cik)
+        normalized_accession = accession_number.replace("-", "")
+        url = urljoin(self.BASE_URL, f"/Archives/edgar/data/{normalized_cik}/{normalized_accession}/index.json")
+
+        response = await self.get(url)
+        return self._parse_directory(response.json())
+
+    async def download_filing_file(
+        self, cik: Union[str, int], accession_number: str, filename: str, output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Download a specific file from a filing.
+
+        Args:
+            cik: The CIK number
+            accession_number: The accession number of the filing
+            filename: The name of the file to download
+            output_dir: Directory to save the file (default: current directory)
+
+        Returns:
+            Path to the downloaded file
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        normalized_cik = _normalize_cik(cik)
+        normalized_accession = accession_number.replace("-", "")
+        url = urljoin(self.BASE_URL, f"/Archives/edgar/data/{normalized_cik}/{normalized_accession}/{filename}")
+
+        response = await self.get(url)
+        # Keep the blocking disk write off the event loop
+        return await asyncio.to_thread(self._write_file, filename, output_dir, response.content)
+
+    async def download_filing_files(
+        self,
+        cik: Union[str, int],
+        accession_number: str,
+        *,
+        extensions: Optional[List[str]] = None,
+        output_dir: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Download all or filtered files from a filing directory concurrently.
+
+        Args:
+            cik: The CIK number
+            accession_number: The accession number of the filing
+            extensions: List of file extensions to download (e.g., ['.xml', '.html'])
+            output_dir: Directory to save the files (default: current directory)
+
+        Returns:
+            List of paths to downloaded files
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        directory = await self.get_filing_directory(cik, accession_number)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.download_filing_file(cik, accession_number, item.name, output_dir)
+                    for item in directory.items
+                    if self._has_extension(item.name, extensions)
+                )
+            )
+        )
@@ -1,16 +1,49 @@
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from functools import lru_cache
+from itertools import islice
 import os
-from typing import Any, Dict, Generator, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urljoin
 
-from httpx import Client, HTTPError, Response
-from pydantic import BaseModel
-from ratelimit import limits, sleep_and_retry  # type: ignore
+from httpx import Client, HTTPError, Limits, Response, codes
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, ValidatorFunctionWrapHandler, field_validator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+FilerRow = Tuple[str, str, str]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cik(cik: Union[str, int]) -> str:
+    """Normalize CIK to 10-digit format."""
+    try:
+        return f"{int(cik):010d}"
+    except ValueError as e:
+        raise ValueError(f"Invalid CIK format: {cik}") from e
+
 
 class EdgarError(Exception):
     """Base exception for EDGAR-related errors."""
@@ -55,10 +88,12 @@ class Filing(BaseModel):
 class Filer(BaseModel):
     """Represents a filer's profile information."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     cik: str
-    entity_type: str
+    entity_type: str = Field(alias="entityType")
     sic: Optional[str] = None
-    sic_description: Optional[str] = None
+    sic_description: Optional[str] = Field(default=None, alias="sicDescription")
     name: str
     tickers: List[str]
     exchanges: List[str]
@@ -66,9 +101,9 @@ class Filer(BaseModel):
     description: Optional[str] = None
     website: Optional[str] = None
     category: Optional[str] = None
-    fiscal_year_end: Optional[str] = None
-    state_of_incorporation: Optional[str] = None
-    phone_number: Optional[str] = None
+    fiscal_year_end: Optional[str] = Field(default=None, alias="fiscalYearEnd")
+    state_of_incorporation: Optional[str] = Field(default=None, alias="stateOfIncorporation")
+    phone_number: Optional[str] = Field(default=None, alias="phone")
     flags: Optional[str] = None
 
 
@@ -89,27 +124,475 @@ class DirectoryListing(BaseModel):
     parent_dir: str
 
 
-class EdgarClient:
-    """Client for interacting with SEC's EDGAR system."""
+class _FilingColumns(BaseModel):
+    """
+    Column-oriented filings as returned by the submissions API.
+
+    Every column is parsed as a whole while the response is decoded. Report dates may be blank and are left for
+    per-filing validation.
+
+    Any cell may be null or malformed, which only invalidates the filing it belongs to.
+    """
+
+    accession_number: List[Optional[str]] = Field(default_factory=list, alias="accessionNumber")
+    form: List[Optional[str]] = Field(default_factory=list)
+    filing_date: List[Optional[datetime]] = Field(default_factory=list, alias="filingDate")
+    report_date: List[Optional[str]] = Field(default_factory=list, alias="reportDate")
+    acceptance_time: List[Optional[datetime]] = Field(default_factory=list, alias="acceptanceDateTime")
+    act: List[Optional[str]] = Field(default_factory=list)
+    size: List[Optional[int]] = Field(default_factory=list)
+    items: List[Optional[str]] = Field(default_factory=list)
+    is_xbrl: List[Optional[int]] = Field(default_factory=list, alias="isXBRL")
+    is_inline_xbrl: List[Optional[int]] = Field(default_factory=list, alias="isInlineXBRL")
+    primary_document: List[Optional[str]] = Field(default_factory=list, alias="primaryDocument")
+    primary_document_description: List[Optional[str]] = Field(default_factory=list, alias="primaryDocDescription")
+
+    @field_validator("*", mode="wrap")
+    @classmethod
+    def _drop_invalid_cells(cls, values: Any, handler: ValidatorFunctionWrapHandler) -> List[Any]:
+        """Parse the column in one pass, falling back to cell by cell so a bad value only voids its own row."""
+        try:
+            return handler(values)
+        except ValidationError:
+            if not isinstance(values, list):
+                raise
+
+        cells: List[Any] = []
+        for value in values:
+            try:
+                cells.append(handler([value])[0])
+            except ValidationError:
+                cells.append(None)
+        return cells
+
+
+class _SubmissionFile(BaseModel):
+    """Reference to an additional submissions file holding older filings."""
+
+    name: str
+
+
+class _SubmissionFilings(BaseModel):
+    """The filings section of a submissions response."""
+
+    recent: _FilingColumns
+    files: List[_SubmissionFile] = Field(default_factory=list)
+
+
+class _Submissions(BaseModel):
+    """A submissions response, reduced to the fields needed to list filings."""
+
+    filings: _SubmissionFilings
+
+
+class _CachedResource(NamedTuple):
+    """A parsed reference file along with the validators needed to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+
+class _FilerIndex(NamedTuple):
+    """Columns of cik-lookup-data.txt, with names lower-cased once for repeated substring searches."""
+
+    names: List[str]
+    names_lower: List[str]
+    ciks: List[str]
+
+    def rows(self) -> Iterator[FilerRow]:
+        return zip(self.names, self.names_lower, self.ciks)
+
+
+class _CompanyTickers(BaseModel):
+    """The company_tickers_exchange.json reference file."""
+
+    data: List[List[Any]] = Field(default_factory=list)
+
+
+class BaseEdgarClient:
+    """Shared configuration and response parsing for the EDGAR clients."""
 
     BASE_URL = "https://www.sec.gov"
     DATA_URL = "https://data.sec.gov"
+    MAX_REQUESTS_PER_SECOND = 10
 
     def __init__(self, user_agent: str = "CompanyName contact@email.com", timeout: int = 30) -> None:
         """
-        Initialize the EDGAR client.
+        Validate and store the client configuration.
 
         Args:
             user_agent: User agent string for SEC requests
             timeout: Request timeout in seconds
-            rate_limit: Maximum requests per second
         """
         if not user_agent or len(user_agent.split()) < 2:
             raise ValueError("User agent must contain company name and contact email as per SEC requirements")
 
         self.user_agent = user_agent
         self.timeout = timeout
-        self.client = Client(timeout=timeout, headers={"User-Agent": user_agent}, follow_redirects=True)
+        self._resource_cache: Dict[str, _CachedResource] = {}
+        self._request_times: Deque[float] = deque(maxlen=self.MAX_REQUESTS_PER_SECOND)
+
+    def _revalidation_headers(self, url: str) -> Dict[str, str]:
+        """Build conditional request headers for a cached resource."""
+        headers = {}
+        cached = self._resource_cache.get(url)
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _cached_resource(self, url: str, response: Response, parse: Callable[[Response], T]) -> T:
+        """
+        Resolve a conditional response against the resource cache.
+
+        Args:
+            url: Request URL
+            response: Response to a request sent with the revalidation headers
+            parse: Converts a full response into the value to cache
+
+        Returns:
+            The cached value if the resource is unchanged, otherwise the freshly parsed value
+        """
+        if response.status_code == codes.NOT_MODIFIED:
+            return self._resource_cache[url].data
+
+        data = parse(response)
+        self._store_resource(url, response, data)
+        return data
+
+    def _store_resource(self, url: str, response: Response, data: Any) -> None:
+        """Cache a parsed resource if the response carries validators to revalidate it with."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._resource_cache[url] = _CachedResource(etag, last_modified, data)
+
+    def _index_filers(self, lines: Iterable[str], index: _FilerIndex) -> Generator[FilerRow, None, None]:
+        """
+        Parse lines of the CIK lookup file into an index, yielding each row as it is added.
+
+        Args:
+            lines: Lines of cik-lookup-data.txt
+            index: Index to append parsed rows to
+
+        Yields:
+            Tuples of name, lower-cased name, and CIK
+        """
+        for line in lines:
+            if not line.strip():
+                continue
+
+            fields = line.split(":")
+            if len(fields) < 3:
+                logger.warning("Skipping malformed line: %s", line)
+                continue
+
+            name = fields[0].strip()
+            cik = fields[1].strip()
+            if not cik.isdigit():
+                logger.warning("Error processing line %s: Invalid CIK format: %s", line, cik)
+                continue
+            # The lookup file already zero-pads CIKs, so skip the int round-trip of _normalize_cik
+            cik = cik.zfill(10)
+
+            name_lower = name.lower()
+            index.names.append(name)
+            index.names_lower.append(name_lower)
+            index.ciks.append(cik)
+            yield name, name_lower, cik
+
+    def _parse_filer_index(self, response: Response) -> _FilerIndex:
+        """Parse a fully read CIK lookup file into an index."""
+        index = _FilerIndex([], [], [])
+        for _ in self._index_filers(response.text.splitlines(), index):
+            pass
+        return index
+
+    def _match_filers(
+        self, rows: Iterable[FilerRow], contains: Optional[str], ciks: Optional[Sequence[Union[str, int]]]
+    ) -> Generator[FilerMatch, None, None]:
+        """
+        Yield the filers from the CIK lookup file matching the filters.
+
+        Args:
+            rows: Tuples of name, lower-cased name, and CIK
+            contains: Filter filer names containing this string (case-insensitive)
+            ciks: Filter by specific CIK numbers
+
+        Yields:
+            FilerMatch objects
+        """
+        normalized_ciks = frozenset(_normalize_cik(cik) for cik in ciks) if ciks else None
+        needle = contains.lower() if contains else None
+
+        for name, name_lower, cik in rows:
+            if normalized_ciks is not None and cik not in normalized_ciks:
+                continue
+            if needle is not None and needle not in name_lower:
+                continue
+
+            yield FilerMatch(name=name, cik=cik)
+
+    def _match_companies(
+        self,
+        rows: List[List[Any]],
+        tickers: Optional[List[str]],
+        ciks: Optional[Sequence[Union[str, int]]],
+        exchanges: Optional[List[str]],
+        contains: Optional[str],
+    ) -> Generator[CompanyMatch, None, None]:
+        """
+        Parse the company tickers file and yield the companies matching the filters.
+
+        Args:
+            rows: Rows of company_tickers_exchange.json
+            tickers: Filter by ticker symbols (case-insensitive)
+            ciks: Filter by CIK numbers
+            exchanges: Filter by exchange names (case-insensitive)
+            contains: Filter company names containing this string (case-insensitive)
+
+        Yields:
+            CompanyMatch objects
+        """
+        normalized_ciks = frozenset(_normalize_cik(cik) for cik in ciks) if ciks else None
+        normalized_tickers = frozenset(t.upper() for t in tickers) if tickers else None
+        normalized_exchanges = frozenset(e.upper() for e in exchanges) if exchanges else None
+        needle = contains.lower() if contains else None
+
+        for row in rows:
+            try:
+                if len(row) != 4:
+                    logger.warning("Skipping malformed company data: %s", row)
+                    continue
+
+                cik = _normalize_cik(row[0])
+                name = str(row[1])
+                ticker = str(row[2])
+                exchange = str(row[3])
+
+                if normalized_ciks is not None and cik not in normalized_ciks:
+                    continue
+                if normalized_tickers is not None and ticker.upper() not in normalized_tickers:
+                    continue
+                if normalized_exchanges is not None and exchange.upper() not in normalized_exchanges:
+                    continue
+                if needle is not None and needle not in name.lower():
+                    continue
+
+                yield CompanyMatch(cik=cik, name=name, ticker=ticker, exchange_name=exchange)
+            except (TypeError, ValueError, IndexError) as e:
+                logger.warning("Error processing company data %s: %s", row, e)
+                continue
+
+    def _collect_filings(
+        self,
+        cik: Union[str, int],
+        batches: Iterable[_FilingColumns],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        forms: Optional[List[str]],
+    ) -> Generator[Filing, None, None]:
+        """
+        Parse batches of filings, skipping duplicates and filings excluded by the filters.
+
+        Args:
+            cik: CIK number
+            batches: Column-oriented filings data, most recent batch first
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by
+
+        Yields:
+            Filing objects
+        """
+        seen_accession_numbers = set()
+        form_filter = frozenset(forms) if forms else None
+
+        for batch in batches:
+            for filing in self._parse_filings(cik, batch, start_date, end_date, form_filter):
+                if filing.accession_number not in seen_accession_numbers:
+                    seen_accession_numbers.add(filing.accession_number)
+                    yield filing
+
+    def _parse_filings(
+        self,
+        cik: Union[str, int],
+        data: _FilingColumns,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        forms: Optional[FrozenSet[str]] = None,
+    ) -> Generator[Filing, None, None]:
+        """
+        Parse filings data into Filing objects.
+
+        Filters are applied column by column to the raw data so that excluded filings are never validated.
+
+        Args:
+            cik: CIK number
+            data: Filings data
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by
+
+        Yields:
+            Filing objects
+        """
+        if not data.accession_number:
+            return
+
+        num_filings = len(data.accession_number)
+        accession_numbers = data.accession_number
+        filing_forms = data.form
+        filing_dates = data.filing_date
+        acceptance_times = data.acceptance_time
+        sizes = data.size
+        is_xbrl = data.is_xbrl
+        is_inline_xbrl = data.is_inline_xbrl
+        primary_documents = data.primary_document
+        primary_document_descriptions = data.primary_document_description
+
+        # Optional columns may be missing or short, so pad them once rather than bounds-checking every row
+        report_dates = self._pad_column(data.report_date, num_filings)
+        acts = self._pad_column(data.act, num_filings)
+        items = self._pad_column(data.items, num_filings)
+
+        documents_url = urljoin(self.BASE_URL, f"/Archives/edgar/data/{cik}/")
+
+        selected = self._select_filings(filing_dates, filing_forms, num_filings, start_date, end_date, forms)
+
+        for i in selected:
+            try:
+                filing_dict: Dict[str, Any] = {
+                    "accession_number": accession_numbers[i],
+                    "form": filing_forms[i],
+                    "filing_date": filing_dates[i],
+                    "acceptance_time": acceptance_times[i],
+                    "size": sizes[i],
+                    "is_xbrl": bool(is_xbrl[i]),
+                    "is_inline_xbrl": bool(is_inline_xbrl[i]),
+                    "primary_document": primary_documents[i] or "",
+                    "primary_document_description": primary_document_descriptions[i] or "",
+                }
+
+                if report_dates[i]:
+                    filing_dict["report_date"] = report_dates[i]
+
+                if acts[i]:
+                    filing_dict["act"] = acts[i]
+
+                filing_items = items[i]
+                if filing_items:
+                    filing_dict["items"] = [item.strip() for item in filing_items.split(",") if item.strip()]
+
+                filing_dict["primary_document_url"] = (
+                    f"{documents_url}{(accession_numbers[i] or '').replace('-', '')}/{filing_dict['primary_document']}"
+                )
+
+                yield Filing.model_validate(filing_dict)
+            except (IndexError, ValueError) as e:
+                logger.debug("Error parsing filing %d: %s", i, e)
+                continue
+
+    @staticmethod
+    def _pad_column(column: List[Optional[str]], length: int) -> List[Optional[str]]:
+        """Extend an optional column with blanks so it can be indexed for every filing."""
+        if len(column) >= length:
+            return column
+        return column + [""] * (length - len(column))
+
+    @staticmethod
+    def _parse_company_tickers(response: Response) -> _CompanyTickers:
+        """Decode the company_tickers_exchange.json reference file."""
+        try:
+            return _CompanyTickers.model_validate_json(response.content)
+        except ValueError as e:
+            raise EdgarError(f"Invalid company data received: {str(e)}") from e
+
+    @staticmethod
+    def _parse_directory(data: Dict[str, Any]) -> DirectoryListing:
+        """Parse a filing's index.json into a DirectoryListing."""
+        # Transform the data to match our model
+        items = []
+        for item in data["directory"]["item"]:
+            items.append(
+                DirectoryItem(
+                    name=item["name"],
+                    type=item["type"],
+                    size=item["size"],
+                    last_modified=datetime.fromisoformat(item["last-modified"]),
+                )
+            )
+
+        return DirectoryListing(items=items, name=data["directory"]["name"], parent_dir=data["directory"]["parent-dir"])
+
+    @staticmethod
+    def _write_file(filename: str, output_dir: Optional[str], content: bytes) -> str:
+        """Write a downloaded file, creating the output directory if needed, and return its path."""
+        output_path = filename
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_path = os.path.join(output_dir, filename)
+
+        with open(output_path, "wb") as f:
+            f.write(content)
+
+        return output_path
+
+    @staticmethod
+    def _has_extension(filename: str, extensions: Optional[List[str]]) -> bool:
+        """Determine if a file matches the extension filter."""
+        if not extensions:
+            return True
+        file_ext = os.path.splitext(filename)[1].lower()
+        return any(file_ext.endswith(ext.lower()) for ext in extensions)
+
+    @staticmethod
+    def _select_filings(
+        filing_dates: List[Optional[datetime]],
+        forms_column: List[Optional[str]],
+        num_filings: int,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        forms: Optional[FrozenSet[str]],
+    ) -> Sequence[int]:
+        """Determine the positions of the filings to include, applying each filter to a whole column."""
+        selected: Sequence[int] = range(num_filings)
+        if start_date or end_date:
+            selected = [
+                i
+                for i, filing_date in zip(selected, filing_dates)
+                if filing_date is not None
+                and not (start_date and filing_date < start_date)
+                and not (end_date and filing_date > end_date)
+            ]
+        if forms is not None:
+            selected = [i for i in selected if i < len(forms_column) and forms_column[i] in forms]
+        return selected
+
+
+class EdgarClient(BaseEdgarClient):
+    """Client for interacting with SEC's EDGAR system."""
+
+    def __init__(self, user_agent: str = "CompanyName contact@email.com", timeout: int = 30) -> None:
+        """
+        Initialize the EDGAR client.
+
+        Args:
+            user_agent: User agent string for SEC requests
+            timeout: Request timeout in seconds
+        """
+        super().__init__(user_agent=user_agent, timeout=timeout)
+        self.client = Client(
+            timeout=timeout,
+            headers={"User-Agent": user_agent},
+            follow_redirects=True,
+            http2=True,
+            limits=Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30),
+        )
+        self._throttle_lock = threading.Lock()
 
     def __enter__(self) -> "EdgarClient":
         return self
@@ -117,14 +600,22 @@ class EdgarClient:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.client.close()
 
-    @sleep_and_retry
-    @limits(calls=10, period=1)
-    def get(self, url: str) -> Response:
+    def _throttle(self) -> None:
+        """Block until a request can be sent without exceeding SEC's rate limit."""
+        with self._throttle_lock:
+            if len(self._request_times) == self._request_times.maxlen:
+                wait = self._request_times[0] + 1.0 - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            self._request_times.append(time.monotonic())
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Response:
         """
         Make a rate-limited GET request.
 
         Args:
             url: Request URL
+            headers: Additional request headers
 
         Returns:
             Response object
@@ -132,18 +623,87 @@ class EdgarClient:
         Raises:
             EdgarError: If the request fails
         """
+        self._throttle()
         try:
-            response = self.client.get(url)
-            response.raise_for_status()
+            response = self.client.get(url, headers=headers)
+            if response.status_code != codes.NOT_MODIFIED:
+                response.raise_for_status()
             return response
         except HTTPError as e:
             raise EdgarError(f"HTTP error occurred: {str(e)}") from e
 
+    @contextmanager
+    def _stream(self, url: str, headers: Optional[Dict[str, str]] = None) -> Iterator[Response]:
+        """
+        Make a rate-limited GET request without reading the response body up front.
+
+        Args:
+            url: Request URL
+            headers: Additional request headers
+
+        Yields:
+            Response object with an unread body
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        self._throttle()
+        try:
+            with self.client.stream("GET", url, headers=headers) as response:
+                if response.status_code != codes.NOT_MODIFIED:
+                    response.raise_for_status()
+                yield response
+        except HTTPError as e:
+            raise EdgarError(f"HTTP error occurred: {str(e)}") from e
+
+    def _filer_rows(self, url: str) -> Generator[FilerRow, None, None]:
+        """
+        Yield the rows of the CIK lookup file, downloading it only if it has changed.
+
+        A download is indexed and cached only once it has been read to the end, so callers may stop early.
+
+        Args:
+            url: Request URL
+
+        Yields:
+            Tuples of name, lower-cased name, and CIK
+        """
+        with self._stream(url, headers=self._revalidation_headers(url)) as response:
+            if response.status_code != codes.NOT_MODIFIED:
+                index = _FilerIndex([], [], [])
+                yield from self._index_filers(response.iter_lines(), index)
+                self._store_resource(url, response, index)
+                return
+
+        yield from self._resource_cache[url].data.rows()
+
+    def iter_filers(
+        self,
+        *,
+        contains: Optional[str] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
+    ) -> Generator[FilerMatch, None, None]:
+        """
+        Lazily search for filers by name or CIK.
+
+        Args:
+            contains: Filter filer names containing this string (case-insensitive)
+            ciks: Filter by specific CIK numbers
+
+        Yields:
+            Matching filers
+
+        Raises:
+            EdgarError: If the request fails
+        """
+        url = urljoin(self.BASE_URL, "/Archives/edgar/cik-lookup-data.txt")
+        yield from self._match_filers(self._filer_rows(url), contains, ciks)
+
     def search_filers(
         self,
         *,
         contains: Optional[str] = None,
-        ciks: Optional[List[str]] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
         limit: Optional[int] = None,
     ) -> List[FilerMatch]:
         """
@@ -160,43 +720,43 @@ class EdgarClient:
         Raises:
             EdgarError: If the request fails
         """
-        url = urljoin(self.BASE_URL, "/Archives/edgar/cik-lookup-data.txt")
-        response = self.get(url)
-
-        normalized_ciks = {self._normalize_cik(cik) for cik in (ciks or [])}
+        matches = self.iter_filers(contains=contains, ciks=ciks)
+        return list(islice(matches, limit)) if limit else list(matches)
 
-        def filer_generator() -> Generator[FilerMatch, None, None]:
-            for line in response.text.splitlines():
-                if not line.strip():
-                    continue
-
-                fields = line.split(":")
-                if len(fields) < 3:
-                    logger.warning(f"Skipping malformed line: {line}")
-                    continue
+    def iter_companies(
+        self,
+        *,
+        tickers: Optional[List[str]] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
+        exchanges: Optional[List[str]] = None,
+        contains: Optional[str] = None,
+    ) -> Generator[CompanyMatch, None, None]:
+        """
+        Lazily search for companies by various criteria.
 
-                try:
-                    name = fields[0].strip()
-                    cik = self._normalize_cik(fields[1])
+        Args:
+            tickers: Filter by ticker symbols (case-insensitive)
+            ciks: Filter by CIK numbers
+            exchanges: Filter by exchange names (case-insensitive)
+            contains: Filter company names containing this string (case-insensitive)
 
-                    if normalized_ciks and cik not in normalized_ciks:
-                        continue
-                    if contains and contains.lower() not in name.lower():
-                        continue
+        Yields:
+            Matching companies
 
-                    yield FilerMatch(name=name, cik=cik)
-                except ValueError as e:
-                    logger.warning(f"Error processing line {line}: {str(e)}")
-                    continue
+        Raises:
+            EdgarError: If the request fails
+        """
+        url = urljoin(self.BASE_URL, "/files/company_tickers_exchange.json")
+        response = self.get(url, headers=self._revalidation_headers(url))
+        data = self._cached_resource(url, response, self._parse_company_tickers)
 
-        matches = list(filer_generator())
-        return matches[:limit] if limit else matches
+        yield from self._match_companies(data.data, tickers, ciks, exchanges, contains)
 
     def search_companies(
         self,
         *,
         tickers: Optional[List[str]] = None,
-        ciks: Optional[List[str]] = None,
+        ciks: Optional[Sequence[Union[str, int]]] = None,
         exchanges: Optional[List[str]] = None,
         contains: Optional[str] = None,
         limit: Optional[int] = None,
@@ -217,45 +777,11 @@ class EdgarClient:
         Raises:
             EdgarError: If the request fails
         """
-        url = urljoin(self.BASE_URL, "/files/company_tickers_exchange.json")
-        response = self.get(url)
-        data = response.json()
-
-        normalized_ciks = {self._normalize_cik(cik) for cik in (ciks or [])}
-        normalized_tickers = {t.upper() for t in (tickers or [])}
-        normalized_exchanges = {e.upper() for e in (exchanges or [])}
-
-        def company_generator() -> Generator[CompanyMatch, None, None]:
-            for row in data.get("data", []):
-                try:
-                    if len(row) != 4:
-                        logger.warning(f"Skipping malformed company data: {row}")
-                        continue
-
-                    cik = self._normalize_cik(str(row[0]))
-                    name = str(row[1])
-                    ticker = str(row[2])
-                    exchange = str(row[3])
-
-                    if normalized_ciks and cik not in normalized_ciks:
-                        continue
-                    if normalized_tickers and ticker.upper() not in normalized_tickers:
-                        continue
-                    if normalized_exchanges and exchange.upper() not in normalized_exchanges:
-                        continue
-                    if contains and contains.lower() not in name.lower():
-                        continue
-
-                    yield CompanyMatch(cik=cik, name=name, ticker=ticker, exchange_name=exchange)
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Error processing company data {row}: {str(e)}")
-                    continue
-
-        companies = list(company_generator())
-        return companies[:limit] if limit else companies
+        companies = self.iter_companies(tickers=tickers, ciks=ciks, exchanges=exchanges, contains=contains)
+        return list(islice(companies, limit)) if limit else list(companies)
 
     @lru_cache(maxsize=100)
-    def get_filer(self, cik: str) -> Filer:
+    def get_filer(self, cik: Union[str, int]) -> Filer:
         """
         Retrieve a filer's profile information.
 
@@ -269,124 +795,142 @@ class EdgarClient:
             EdgarError: If the request fails
             ValueError: If CIK is invalid
         """
-        normalized_cik = self._normalize_cik(cik)
+        normalized_cik = _normalize_cik(cik)
         url = urljoin(self.DATA_URL, f"submissions/CIK{normalized_cik}.json")
         response = self.get(url)
         try:
-            return Filer.model_validate(response.json())
+            return Filer.model_validate_json(response.content)
         except ValueError as e:
             raise EdgarError(f"Invalid filer data received: {str(e)}") from e
 
-    def get_filings(
+    def iter_filings(
         self,
-        cik: str,
+        cik: Union[str, int],
         *,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         forms: Optional[List[str]] = None,
-        limit: Optional[int] = None,
-    ) -> List[Filing]:
+    ) -> Generator[Filing, None, None]:
         """
-        Retrieve filings for a given CIK.
+        Lazily retrieve filings for a given CIK, most recent first.
+
+        Older submission files are only fetched once the filings before them have been consumed.
 
         Args:
             cik: CIK number
             start_date: Start date for filtering filings
             end_date: End date for filtering filings
             forms: Forms to filter by (e.g., ["10-K", "10-Q"])
-            limit: Maximum number of filings to return
 
-        Returns:
-            List of filings
+        Yields:
+            Filing objects
 
         Raises:
-            EDGARError: If the request fails
+            EdgarError: If the request fails
             ValueError: If CIK is invalid
         """
-        normalized_cik = self._normalize_cik(cik)
+        normalized_cik = _normalize_cik(cik)
         url = urljoin(self.DATA_URL, f"submissions/CIK{normalized_cik}.json")
         response = self.get(url)
-        data = response.json()
-
-        def filing_generator() -> Generator[Filing, None, None]:
-            seen_accession_numbers = set()
+        try:
+            data = _Submissions.model_validate_json(response.content)
+        except ValueError as e:
+            raise EdgarError(f"Invalid filings data received: {str(e)}") from e
 
-            for filing in self._parse_filings(cik, data["filings"]["recent"]):
-                if filing.accession_number not in seen_accession_numbers:
-                    seen_accession_numbers.add(filing.accession_number)
-                    if self._should_include_filing(filing, start_date, end_date, forms):
-                        yield filing
+        def batches() -> Generator[_FilingColumns, None, None]:
+            yield data.filings.recent
 
-            for file in data["filings"].get("files", []):
+            for file in data.filings.files:
                 try:
-                    file_url = urljoin(self.DATA_URL, f"submissions/{file['name']}")
+                    file_url = urljoin(self.DATA_URL, f"submissions/{file.name}")
                     file_response = self.get(file_url)
-                    file_data = file_response.json()
-
-                    for filing in self._parse_filings(cik, file_data):
-                        if filing.accession_number not in seen_accession_numbers:
-                            seen_accession_numbers.add(filing.accession_number)
-                            if self._should_include_filing(filing, start_date, end_date, forms):
-                                yield filing
+                    yield _FilingColumns.model_validate_json(file_response.content)
                 except Exception as e:
-                    logger.error(f"Error processing filing file {file['name']}: {str(e)}")
+                    logger.error("Error processing filing file %s: %s", file.name, e)
                     continue
 
-        filings = list(filing_generator())
-        return filings[:limit] if limit else filings
+        yield from self._collect_filings(cik, batches(), start_date, end_date, forms)
 
-    def _parse_filings(self, cik: str, data: Dict[str, Any]) -> Generator[Filing, None, None]:
+    def get_filings(
+        self,
+        cik: Union[str, int],
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        forms: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Filing]:
         """
-        Parse filings data into Filing objects.
+        Retrieve filings for a given CIK.
 
         Args:
-            data: Filings data
+            cik: CIK number
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by (e.g., ["10-K", "10-Q"])
+            limit: Maximum number of filings to return
 
-        Yields:
-            Filing objects
+        Returns:
+            List of filings
+
+        Raises:
+            EDGARError: If the request fails
+            ValueError: If CIK is invalid
         """
-        if not data.get("accessionNumber"):
-            return
+        filings = self.iter_filings(cik, start_date=start_date, end_date=end_date, forms=forms)
+        return list(islice(filings, limit)) if limit else list(filings)
 
-        num_filings = len(data["accessionNumber"])
+    def get_filers(self, ciks: Sequence[Union[str, int]]) -> List[Filer]:
+        """
+        Retrieve the profiles of several filers concurrently.
 
-        for i in range(num_filings):
-            try:
-                filing_dict = {
-                    "accession_number": data["accessionNumber"][i],
-                    "form": data["form"][i],
-                    "filing_date": datetime.strptime(data["filingDate"][i], "%Y-%m-%d"),
-                    "acceptance_time": datetime.strptime(
-                        data["acceptanceDateTime"][i].replace(".000Z", "+0000"),
-                        "%Y-%m-%dT%H:%M:%S%z",
-                    ),
-                    "size": data["size"][i],
-                    "is_xbrl": bool(data["isXBRL"][i]),
-                    "is_inline_xbrl": bool(data["isInlineXBRL"][i]),
-                    "primary_document": data["primaryDocument"][i] or "",
-                    "primary_document_description": data["primaryDocDescription"][i] or "",
-                }
+        Args:
+            ciks: CIK numbers
 
-                if "reportDate" in data and i < len(data["reportDate"]) and data["reportDate"][i]:
-                    filing_dict["report_date"] = datetime.strptime(data["reportDate"][i], "%Y-%m-%d")
+        Returns:
+            Filer profiles, in the same order as the CIKs
 
-                if "act" in data and i < len(data["act"]) and data["act"][i]:
-                    filing_dict["act"] = data["act"][i]
+        Raises:
+            EdgarError: If any request fails
+            ValueError: If any CIK is invalid
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_REQUESTS_PER_SECOND) as executor:
+            return list(executor.map(self.get_filer, ciks))
 
-                if "items" in data and i < len(data["items"]) and data["items"][i]:
-                    filing_dict["items"] = [item.strip() for item in data["items"][i].split(",") if item.strip()]
+    def get_filings_bulk(
+        self,
+        ciks: Sequence[Union[str, int]],
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        forms: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[Union[str, int], List[Filing]]:
+        """
+        Retrieve filings for several CIKs concurrently.
 
-                filing_dict["primary_document_url"] = urljoin(
-                    self.BASE_URL,
-                    f"/Archives/edgar/data/{cik}/{filing_dict['accession_number'].replace('-', '')}/{filing_dict['primary_document']}",
-                )
+        Args:
+            ciks: CIK numbers
+            start_date: Start date for filtering filings
+            end_date: End date for filtering filings
+            forms: Forms to filter by (e.g., ["10-K", "10-Q"])
+            limit: Maximum number of filings to return per CIK
 
-                yield Filing.model_validate(filing_dict)
-            except (KeyError, IndexError, ValueError) as e:
-                logger.warning(f"Error parsing filing {i}: {str(e)}")
-                continue
+        Returns:
+            Filings keyed by CIK, as given
+
+        Raises:
+            EdgarError: If any request fails
+            ValueError: If any CIK is invalid
+        """
+
+        def get_filings(cik: Union[str, int]) -> List[Filing]:
+            return self.get_filings(cik, start_date=start_date, end_date=end_date, forms=forms, limit=limit)
 
-    def get_filing_directory(self, cik: str, accession_number: str) -> DirectoryListing:
+        with ThreadPoolExecutor(max_workers=self.MAX_REQUESTS_PER_SECOND) as executor:
+            return dict(zip(ciks, executor.map(get_filings, ciks)))
+
+    def get_filing_directory(self, cik: Union[str, int], accession_number: str) -> DirectoryListing:
         """
         Get the directory listing for a specific filing.
 
@@ -400,29 +944,15 @@ class EdgarClient:
         Raises:
             EdgarError: If the request fails
         """
-        normalized_cik = self._normalize_cik(cik)
+        normalized_cik = _normalize_cik(cik)
         normalized_accession = accession_number.replace("-", "")
         url = urljoin(self.BASE_URL, f"/Archives/edgar/data/{normalized_cik}/{normalized_accession}/index.json")
 
         response = self.get(url)
-        data = response.json()
-
-        # Transform the data to match our model
-        items = []
-        for item in data["directory"]["item"]:
-            items.append(
-                DirectoryItem(
-                    name=item["name"],
-                    type=item["type"],
-                    size=item["size"],
-                    last_modified=datetime.strptime(item["last-modified"], "%Y-%m-%d %H:%M:%S"),
-                )
-            )
-
-        return DirectoryListing(items=items, name=data["directory"]["name"], parent_dir=data["directory"]["parent-dir"])
+        return self._parse_directory(response.json())
 
     def download_filing_file(
-        self, cik: str, accession_number: str, filename: str, output_dir: Optional[str] = None
+        self, cik: Union[str, int], accession_number: str, filename: str, output_dir: Optional[str] = None
     ) -> str:
         """
         Download a specific file from a filing.
@@ -439,26 +969,16 @@ class EdgarClient:
         Raises:
             EdgarError: If the request fails
         """
-        normalized_cik = self._normalize_cik(cik)
+        normalized_cik = _normalize_cik(cik)
         normalized_accession = accession_number.replace("-", "")
         url = urljoin(self.BASE_URL, f"/Archives/edgar/data/{normalized_cik}/{normalized_accession}/{filename}")
 
         response = self.get(url)
-
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, filename)
-        else:
-            output_path = filename
-
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-
-        return output_path
+        return self._write_file(filename, output_dir, response.content)
 
     def download_filing_files(
         self,
-        cik: str,
+        cik: Union[str, int],
         accession_number: str,
         *,
         extensions: Optional[List[str]] = None,
@@ -483,36 +1003,10 @@ class EdgarClient:
         downloaded_files = []
 
         for item in directory.items:
-            if extensions:
-                file_ext = os.path.splitext(item.name)[1].lower()
-                if not any(file_ext.endswith(ext.lower()) for ext in extensions):
-                    continue
+            if not self._has_extension(item.name, extensions):
+                continue
 
             file_path = self.download_filing_file(cik, accession_number, item.name, output_dir)
             downloaded_files.append(file_path)
 
         return downloaded_files
-
-    @staticmethod
-    def _normalize_cik(cik: str) -> str:
-        """Normalize CIK to 10-digit format."""
-        try:
-            return f"{int(cik):010d}"
-        except ValueError as e:
-            raise ValueError(f"Invalid CIK format: {cik}") from e
-
-    @staticmethod
-    def _should_include_filing(
-        filing: Filing,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime],
-        forms: Optional[List[str]],
-    ) -> bool:
-        """Determine if a filing should be included based on filters."""
-        if start_date and filing.filing_date < start_date:
-            return False
-        if end_date and filing.filing_date > end_date:
-            return False
-        if forms and filing.form not in forms:
-            return False
-        return True
@@ -0,0 +1,65 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from edgar_client import AsyncEdgarClient
+from edgar_client import async_client as async_client_module
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_throttle_waits_for_the_oldest_request_to_leave_the_window(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(async_client_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(async_client_module.asyncio, "sleep", clock.sleep)
+
+    async def run() -> List[float]:
+        async with AsyncEdgarClient(user_agent="CompanyName contact@email.com") as client:
+            for _ in range(10):
+                await client._throttle()
+                clock.now += 0.05
+            times = list(client._request_times)
+
+            assert clock.sleeps == []
+
+            await client._throttle()
+            return times
+
+    times = asyncio.run(run())
+
+    assert clock.sleeps == [pytest.approx(times[0] + 1.0 - (times[-1] + 0.05))]
+    assert clock.now == pytest.approx(times[0] + 1.0)
+
+
+def test_download_filing_file_and_search_filers_in_worker_threads(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("cik-lookup-data.txt"):
+            return httpx.Response(200, text="APPLE INC:0000320193:\nMICROSOFT CORP:0000789019:\n")
+        return httpx.Response(200, content=b"<html></html>")
+
+    async def run():
+        async with AsyncEdgarClient(user_agent="CompanyName contact@email.com") as client:
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            path = await client.download_filing_file(
+                "320193", "0000320193-24-000123", "aapl-20240928.htm", str(tmp_path / "out")
+            )
+            filers = await client.search_filers(contains="apple")
+            return path, filers
+
+    path, filers = asyncio.run(run())
+
+    assert open(path, "rb").read() == b"<html></html>"
+    assert [filer.cik for filer in filers] == ["0000320193"]
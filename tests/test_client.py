@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List
+
+import httpx
+import pytest
+
+from edgar_client import client as client_module
+
+from edgar_client import EdgarClient
+
+
+def make_filings(**overrides: Any) -> Dict[str, Any]:
+    filings: Dict[str, Any] = {
+        "accessionNumber": ["0000320193-24-000123", "0000320193-24-000081", "0000320193-24-000069"],
+        "filingDate": ["2024-11-01", "2024-08-02", "2024-05-03"],
+        "reportDate": ["2024-09-28", "2024-06-29", "2024-03-30"],
+        "acceptanceDateTime": ["2024-11-01T06:01:36.000Z", "2024-08-02T06:01:24.000Z", "2024-05-03T06:01:42.000Z"],
+        "act": ["34", "34", "34"],
+        "form": ["10-K", "10-Q", "10-Q"],
+        "size": [9759333, 5876236, 5397466],
+        "items": ["", "", ""],
+        "isXBRL": [1, 1, 1],
+        "isInlineXBRL": [1, 1, 1],
+        "primaryDocument": ["aapl-20240928.htm", "aapl-20240629.htm", "aapl-20240330.htm"],
+        "primaryDocDescription": ["10-K", "10-Q", "10-Q"],
+    }
+    filings.update(overrides)
+    return filings
+
+
+def mock_client(handler: Callable[[httpx.Request], httpx.Response]) -> EdgarClient:
+    client = EdgarClient(user_agent="CompanyName contact@email.com")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def make_client():
+    def factory(recent: Dict[str, Any]) -> EdgarClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"cik": "320193", "filings": {"recent": recent, "files": []}})
+
+        return mock_client(handler)
+
+    return factory
+
+
+def test_get_filings_tolerates_null_cells(make_client):
+    recent = make_filings(
+        primaryDocument=["aapl-20240928.htm", None, "aapl-20240330.htm"],
+        primaryDocDescription=[None, "10-Q", "10-Q"],
+        act=["34", None, "34"],
+        items=[None, "", ""],
+        reportDate=["2024-09-28", "2024-06-29", None],
+        isXBRL=[1, None, 1],
+    )
+
+    with make_client(recent) as client:
+        filings = client.get_filings("320193")
+
+    assert [filing.accession_number for filing in filings] == recent["accessionNumber"]
+    assert filings[0].primary_document_description == ""
+    assert filings[0].items is None
+    assert filings[1].primary_document == ""
+    assert filings[1].act is None
+    assert filings[1].is_xbrl is False
+    assert filings[2].report_date is None
+
+
+def test_get_filings_skips_rows_with_invalid_timestamps(make_client):
+    recent = make_filings(
+        filingDate=["2024-11-01", "", "2024-05-03"],
+        acceptanceDateTime=["2024-11-01T06:01:36.000Z", "2024-08-02T06:01:24.000Z", "not a timestamp"],
+    )
+
+    with make_client(recent) as client:
+        filings = client.get_filings("320193")
+        filtered = client.get_filings("320193", start_date=datetime(2024, 1, 1))
+
+    assert [filing.accession_number for filing in filings] == ["0000320193-24-000123"]
+    assert [filing.accession_number for filing in filtered] == ["0000320193-24-000123"]
+
+
+def test_get_filings_skips_rows_with_malformed_cells(make_client):
+    recent = make_filings(
+        size=["abc", 5876236, 5397466],
+        isXBRL=[1, "x", 1],
+        form=["10-K", "10-Q", {"type": "10-Q"}],
+    )
+
+    with make_client(recent) as client:
+        filings = client.get_filings("320193")
+
+    assert [filing.accession_number for filing in filings] == ["0000320193-24-000081"]
+    assert filings[0].is_xbrl is False
+
+
+COMPANY_TICKERS = {
+    "fields": ["cik", "name", "ticker", "exchange"],
+    "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"], [789019, "MICROSOFT CORP", "MSFT", "Nasdaq"]],
+}
+VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Fri, 01 Nov 2024 06:00:00 GMT"}
+
+
+def test_search_companies_revalidates_cached_tickers():
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == VALIDATORS["ETag"]:
+            return httpx.Response(304, headers=VALIDATORS)
+        return httpx.Response(200, json=COMPANY_TICKERS, headers=VALIDATORS)
+
+    with mock_client(handler) as client:
+        first = client.search_companies(tickers=["aapl"])
+        second = client.search_companies(tickers=["aapl"])
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == VALIDATORS["ETag"]
+    assert requests[1].headers["If-Modified-Since"] == VALIDATORS["Last-Modified"]
+    assert [company.name for company in first] == ["Apple Inc."]
+    assert second == first
+
+
+def test_search_companies_does_not_cache_without_validators():
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=COMPANY_TICKERS)
+
+    with mock_client(handler) as client:
+        client.search_companies()
+        companies = client.search_companies()
+
+    assert client._resource_cache == {}
+    assert "If-None-Match" not in requests[1].headers
+    assert "If-Modified-Since" not in requests[1].headers
+    assert len(companies) == 2
+
+
+def test_get_returns_not_modified_response():
+    with mock_client(lambda request: httpx.Response(304)) as client:
+        response = client.get("https://www.sec.gov/files/company_tickers_exchange.json")
+
+    assert response.status_code == 304
+
+
+FILER_LINES = [b"APPLE INC:0000320193:\n", b"MICROSOFT CORP:0000789019:\n", b"TESLA, INC.:0001318605:\n"]
+
+
+class RecordingStream(httpx.SyncByteStream):
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks = chunks
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_search_filers_with_limit_stops_reading_early():
+    stream = RecordingStream(FILER_LINES)
+
+    with mock_client(lambda request: httpx.Response(200, stream=stream, headers=VALIDATORS)) as client:
+        filers = client.search_filers(limit=1)
+
+    assert [filer.name for filer in filers] == ["APPLE INC"]
+    assert stream.read < len(FILER_LINES)
+    assert stream.closed
+    assert client._resource_cache == {}
+
+
+def test_search_filers_caches_a_full_read():
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == VALIDATORS["ETag"]:
+            return httpx.Response(304, headers=VALIDATORS)
+        return httpx.Response(200, stream=RecordingStream(FILER_LINES), headers=VALIDATORS)
+
+    with mock_client(handler) as client:
+        first = client.search_filers()
+        second = client.search_filers()
+
+    assert requests[1].headers["If-None-Match"] == VALIDATORS["ETag"]
+    assert [filer.cik for filer in first] == ["0000320193", "0000789019", "0001318605"]
+    assert second == first
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_throttle_waits_for_the_oldest_request_to_leave_the_window(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(client_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(client_module.time, "sleep", clock.sleep)
+
+    with EdgarClient(user_agent="CompanyName contact@email.com") as client:
+        for _ in range(10):
+            client._throttle()
+            clock.now += 0.05
+        times = list(client._request_times)
+
+        assert clock.sleeps == []
+
+        client._throttle()
+
+    assert clock.sleeps == [pytest.approx(times[0] + 1.0 - (times[-1] + 0.05))]
+    assert clock.now == pytest.approx(times[0] + 1.0)
+    assert client._request_times[-1] == pytest.approx(times[0] + 1.0)